@@ -0,0 +1,22 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.12"
+# dependencies = [
+#   "cython",
+#   "setuptools",
+# ]
+# ///
+import argparse
+
+# Compiles vcf_rewrite.pyx (next to this script) on first import and caches the build
+import pyximport
+pyximport.install(language_level=3)
+
+import vcf_rewrite
+
+parser = argparse.ArgumentParser(description='Modify VCF IDs using a Cython extension')
+parser.add_argument('-i', '--input', required=True, help='Input VCF file')
+parser.add_argument('-o', '--output', required=True, help='Output VCF file')
+args = parser.parse_args()
+
+vcf_rewrite.rewrite(args.input, args.output)
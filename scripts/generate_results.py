@@ -1,12 +1,18 @@
 #!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.12"
+# dependencies = [
+#   "orjson",
+# ]
+# ///
 """
 Generate results documentation from benchmark JSON files.
 This script reads all the benchmark results and generates a markdown file
 with tables and mermaid.js charts for visualization.
 """
 
-import json
-import os
+import orjson
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict
 
@@ -14,34 +20,38 @@ def load_results(results_dir: Path) -> List[Dict]:
     """Load all result JSON files from the results directory."""
     results = []
 
-    # Walk through all subdirectories
-    for root, dirs, files in os.walk(results_dir):
-        for file in files:
-            if file == 'results.json':
-                filepath = Path(root) / file
-                with open(filepath, 'r') as f:
-                    data = json.load(f)
-                    results.append(data)
+    # Find result files in all subdirectories
+    for filepath in results_dir.rglob('results.json'):
+        with filepath.open('rb') as f:
+            data = orjson.loads(f.read())
+            results.append(data)
 
     # Sort by time for consistent ordering
     results.sort(key=lambda x: float(x['time_seconds']))
 
     return results
 
+# Human-readable names for each approach ID
+APPROACH_NAMES = {
+    'baseline_cat': 'Baseline (cat)',
+    'awk': 'AWK',
+    'python_vanilla': 'Python (vanilla)',
+    'python_maxsplit': 'Python (maxsplit)',
+    'python_maxsplit_dowhile': 'Python (maxsplit+dowhile)',
+    'python_pandas': 'Python (pandas)',
+    'python_cyvcf2': 'Python (cyvcf2)',
+    'python_scikit_allel': 'Python (scikit-allel)',
+    'rust': 'Rust',
+    'python_cython': 'Python (Cython)',
+    'python_rust_pyo3': 'Python (Rust extension)',
+    'python_pyarrow': 'Python (pyarrow)',
+    'python_multiprocessing': 'Python (multiprocessing)',
+}
+
+@lru_cache(maxsize=32)
 def format_approach_name(approach: str) -> str:
     """Convert approach ID to human-readable name."""
-    name_map = {
-        'baseline_cat': 'Baseline (cat)',
-        'awk': 'AWK',
-        'python_vanilla': 'Python (vanilla)',
-        'python_maxsplit': 'Python (maxsplit)',
-        'python_maxsplit_dowhile': 'Python (maxsplit+dowhile)',
-        'python_pandas': 'Python (pandas)',
-        'python_cyvcf2': 'Python (cyvcf2)',
-        'python_scikit_allel': 'Python (scikit-allel)',
-        'rust': 'Rust',
-    }
-    return name_map.get(approach, approach)
+    return APPROACH_NAMES.get(approach, approach)
 
 def generate_time_chart(results: List[Dict]) -> str:
     """Generate mermaid.js xychart for execution time."""
@@ -108,9 +118,10 @@ xychart horizontal
 def generate_results_table(results: List[Dict]) -> str:
     """Generate markdown table with all results."""
 
-    table = """| Approach | Time (seconds) | Memory (MB) | MD5 Checksum | Notes |
-|----------|---------------|-------------|--------------|-------|
-"""
+    rows = [
+        "| Approach | Time (seconds) | Memory (MB) | MD5 Checksum | Notes |",
+        "|----------|---------------|-------------|--------------|-------|",
+    ]
 
     # Find the most common MD5 (should be the correct one)
     md5_counts = {}
@@ -134,50 +145,64 @@ def generate_results_table(results: List[Dict]) -> str:
         else:
             md5_display += ' ✓'
 
-        table += f"| {approach} | {time_sec:.3f} | {memory_mb:.1f} | `{md5_display}` | {note} |\n"
+        rows.append(f"| {approach} | {time_sec:.3f} | {memory_mb:.1f} | `{md5_display}` | {note} |")
 
-    return table
+    return '\n'.join(rows) + '\n'
 
 def generate_performance_insights(results: List[Dict]) -> str:
     """Generate insights section comparing performance."""
 
-    # Exclude baseline for comparisons
-    processing_results = [r for r in results if r['approach'] != 'baseline_cat']
+    # Track (approach, value) for each extreme in a single pass over the results,
+    # parsing each record's time and memory only once. Baseline is excluded from comparisons
+    fastest = slowest = least_memory = most_memory = baseline = None
 
-    if not processing_results:
+    for r in results:
+        approach = r['approach']
+        time_sec = float(r['time_seconds'])
+        memory_kb = float(r['memory_kb'])
+
+        if approach == 'baseline_cat':
+            if baseline is None:
+                baseline = (approach, time_sec)
+            continue
+
+        if fastest is None or time_sec < fastest[1]:
+            fastest = (approach, time_sec)
+        if slowest is None or time_sec > slowest[1]:
+            slowest = (approach, time_sec)
+        if least_memory is None or memory_kb < least_memory[1]:
+            least_memory = (approach, memory_kb)
+        if most_memory is None or memory_kb > most_memory[1]:
+            most_memory = (approach, memory_kb)
+
+    if fastest is None:
         return ""
 
-    fastest = min(processing_results, key=lambda x: float(x['time_seconds']))
-    slowest = max(processing_results, key=lambda x: float(x['time_seconds']))
-    least_memory = min(processing_results, key=lambda x: float(x['memory_kb']))
-    most_memory = max(processing_results, key=lambda x: float(x['memory_kb']))
-
-    baseline = next((r for r in results if r['approach'] == 'baseline_cat'), None)
-
-    section = """## Performance Insights
-
-### Speed
-"""
+    lines = [
+        "## Performance Insights",
+        "",
+        "### Speed",
+    ]
 
-    section += f"- **Fastest**: {format_approach_name(fastest['approach'])} at {float(fastest['time_seconds']):.3f} seconds\n"
-    section += f"- **Slowest**: {format_approach_name(slowest['approach'])} at {float(slowest['time_seconds']):.3f} seconds\n"
+    lines.append(f"- **Fastest**: {format_approach_name(fastest[0])} at {fastest[1]:.3f} seconds")
+    lines.append(f"- **Slowest**: {format_approach_name(slowest[0])} at {slowest[1]:.3f} seconds")
 
-    speedup = float(slowest['time_seconds']) / float(fastest['time_seconds'])
-    section += f"- **Speed difference**: {speedup:.2f}x (fastest vs slowest)\n"
+    speedup = slowest[1] / fastest[1]
+    lines.append(f"- **Speed difference**: {speedup:.2f}x (fastest vs slowest)")
 
     if baseline:
-        overhead = float(fastest['time_seconds']) - float(baseline['time_seconds'])
-        overhead_pct = (overhead / float(baseline['time_seconds'])) * 100
-        section += f"- **Minimum processing overhead**: {overhead:.3f} seconds ({overhead_pct:.1f}% over baseline I/O)\n"
+        overhead = fastest[1] - baseline[1]
+        overhead_pct = (overhead / baseline[1]) * 100
+        lines.append(f"- **Minimum processing overhead**: {overhead:.3f} seconds ({overhead_pct:.1f}% over baseline I/O)")
 
-    section += "\n### Memory\n\n"
-    section += f"- **Least memory**: {format_approach_name(least_memory['approach'])} at {float(least_memory['memory_kb'])/1024:.1f} MB\n"
-    section += f"- **Most memory**: {format_approach_name(most_memory['approach'])} at {float(most_memory['memory_kb'])/1024:.1f} MB\n"
+    lines += ["", "### Memory", ""]
+    lines.append(f"- **Least memory**: {format_approach_name(least_memory[0])} at {least_memory[1]/1024:.1f} MB")
+    lines.append(f"- **Most memory**: {format_approach_name(most_memory[0])} at {most_memory[1]/1024:.1f} MB")
 
-    mem_ratio = float(most_memory['memory_kb']) / float(least_memory['memory_kb'])
-    section += f"- **Memory difference**: {mem_ratio:.2f}x (most vs least)\n"
+    mem_ratio = most_memory[1] / least_memory[1]
+    lines.append(f"- **Memory difference**: {mem_ratio:.2f}x (most vs least)")
 
-    return section
+    return '\n'.join(lines) + '\n'
 
 def main():
     """Main function to generate results documentation."""
@@ -3,9 +3,12 @@
 # requires-python = ">=3.12"
 # dependencies = [
 #   "pandas",
+#   "pyarrow",
 # ]
 # ///
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 import argparse
 
 parser = argparse.ArgumentParser(description="Modify VCF IDs using pandas")
@@ -23,18 +26,26 @@ with open(args.input) as in_f:
 
         out_f.write(line)
 
-# Read VCF data (skip header lines)
-df = pd.read_csv(
+# Read VCF data (skip header lines) in chunks so only one chunk is in memory at a time.
+# Everything is read as str, so no type inference or conversion back is needed
+reader = pd.read_csv(
     args.input,
     sep="\t",
     comment="#",
-    header=None
+    header=None,
+    dtype=str,
+    engine="c",
+    chunksize=131072
 )
 
-# Update ID column (column index 2) to match new coordinates
-df[2] = df[0].astype(str) + ":" + df[1].astype(str) + ":" + df[3] + ":" + df[4]
+for chunk in reader:
+    # Update ID column (column index 2) to match new coordinates.
+    # Arrow joins all four columns in a single pass instead of one
+    # intermediate object Series per "+"
+    cols = [pa.array(chunk[i], type=pa.string()) for i in (0, 1, 3, 4)]
+    chunk[2] = pc.binary_join_element_wise(*cols, ":").to_numpy(zero_copy_only=False)
 
-# Append data to VCF output
-df.to_csv(out_f, sep="\t", index=False, header=False, mode="a")
+    # Append data to VCF output
+    chunk.to_csv(out_f, sep="\t", index=False, header=False, mode="a")
 
 out_f.close()
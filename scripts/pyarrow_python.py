@@ -0,0 +1,67 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.12"
+# dependencies = [
+#   "pyarrow",
+# ]
+# ///
+import pyarrow as pa
+import pyarrow.compute as pc
+from pyarrow import csv
+import argparse
+import os
+
+parser = argparse.ArgumentParser(description="Modify VCF IDs using pyarrow")
+parser.add_argument("-i", "--input", required=True, help="Input VCF file")
+parser.add_argument("-o", "--output", required=True, help="Output VCF file")
+args = parser.parse_args()
+
+# Collect header lines to copy to the output unchanged. Arrow's CSV reader has no
+# notion of comment lines, so count them to skip and take column names from "#CHROM"
+header = []
+names = None
+has_data = False
+with open(args.input, "rb") as in_f:
+    for line in in_f:
+        if not line.startswith(b"#"):
+            has_data = True
+            break
+
+        header.append(line)
+        if line.startswith(b"#CHROM"):
+            names = line.rstrip(b"\n").decode().split("\t")
+
+if has_data and names is None:
+    raise ValueError(f"{args.input} has data lines but no #CHROM header line to take column names from")
+
+# A header-only (or empty) VCF has no rows for Arrow to read
+if has_data:
+    # Read VCF data (skip header lines) with Arrow's multithreaded parser.
+    # Every column is read as a string so values are written back unchanged
+    table = csv.read_csv(
+        args.input,
+        read_options=csv.ReadOptions(skip_rows=len(header), column_names=names, use_threads=True),
+        parse_options=csv.ParseOptions(delimiter="\t", quote_char=False),
+        convert_options=csv.ConvertOptions(column_types=dict.fromkeys(names, pa.string())),
+    )
+
+    # Update ID column (column index 2) to match new coordinates
+    ids = pc.binary_join_element_wise(table[0], table[1], table[3], table[4], ":")
+    table = table.set_column(2, names[2], ids)
+
+try:
+    with open(args.output, "wb") as out_f:
+        out_f.writelines(header)
+
+        # Append data to VCF output
+        if has_data:
+            csv.write_csv(
+                table,
+                out_f,
+                write_options=csv.WriteOptions(include_header=False, delimiter="\t", quoting_style="none"),
+            )
+except pa.ArrowInvalid as err:
+    # Arrow refuses to write values containing '"' (e.g. quoted INFO strings) unquoted,
+    # so don't leave a header-only output behind
+    os.remove(args.output)
+    raise ValueError(f"{args.input} has values Arrow's CSV writer can't write unquoted: {err}") from err
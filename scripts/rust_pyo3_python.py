@@ -0,0 +1,21 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.12"
+# dependencies = [
+#   "vcf-rewrite-rs",
+# ]
+#
+# [tool.uv.sources]
+# vcf-rewrite-rs = { path = "vcf_rewrite_rs" }
+# ///
+import argparse
+
+# Rust extension built from vcf_rewrite_rs/ (next to this script) by maturin
+import vcf_rewrite_rs
+
+parser = argparse.ArgumentParser(description='Modify VCF IDs using a Rust (PyO3) extension')
+parser.add_argument('-i', '--input', required=True, help='Input VCF file')
+parser.add_argument('-o', '--output', required=True, help='Output VCF file')
+args = parser.parse_args()
+
+vcf_rewrite_rs.rewrite(args.input, args.output)
@@ -4,24 +4,47 @@
 # dependencies = []
 # ///
 import argparse
+import os
+
+# Output is collected in a buffer and written to the raw fd once it reaches this size
+FLUSH_SIZE = 1 << 20
+
+def write_all(fd, data):
+    """os.write may write only part of the buffer, keep going until all of it is written."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
 
 parser = argparse.ArgumentParser(description='Modify VCF IDs using vanilla python with maxsplit and do-while approach for headers')
 parser.add_argument('-i', '--input', required=True, help='Input VCF file')
 parser.add_argument('-o', '--output', required=True, help='Output VCF file')
 args = parser.parse_args()
 
-with open(args.input) as f_in, open(args.output, "w") as f_out:
+# Bytes in and a raw fd out, so there is no decoding, encoding or TextIOWrapper layer.
+# The input is opened first so a missing input doesn't leave an empty output behind
+with open(args.input, "rb") as f_in:
+    out_fd = os.open(args.output, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    out = bytearray()
 
-    # Output header lines unchanged 
+    # Output header lines unchanged
     for line in f_in:
-        if not line.startswith("#"):
+        if not line.startswith(b"#"):
             break
 
-        f_out.write(line)
+        out += line
+    else:
+        line = b""
 
     # The rest of the lines won't be headers. Adjust ID col and write
     while line:
-        chrom,pos,_,ref,alt,rest = line.split("\t", maxsplit=5)
-        f_out.write(f"{chrom}\t{pos}\t{chrom}:{pos}:{ref}:{alt}\t{ref}\t{alt}\t{rest}")
+        chrom,pos,_,ref,alt,rest = line.split(b"\t", maxsplit=5)
+        out += b"".join((chrom,b"\t",pos,b"\t",chrom,b":",pos,b":",ref,b":",alt,b"\t",ref,b"\t",alt,b"\t",rest))
+
+        if len(out) >= FLUSH_SIZE:
+            write_all(out_fd, out)
+            out.clear()
 
         line = f_in.readline()
+
+write_all(out_fd, out)
+os.close(out_fd)
@@ -5,18 +5,45 @@
 # ///
 import argparse
 
+# Read and write in large binary blocks instead of line by line
+CHUNK_SIZE = 1 << 22
+
 parser = argparse.ArgumentParser(description='Modify VCF IDs using vanilla python with maxsplit')
 parser.add_argument('-i', '--input', required=True, help='Input VCF file')
 parser.add_argument('-o', '--output', required=True, help='Output VCF file')
 args = parser.parse_args()
 
-with open(args.input) as f_in, open(args.output, "w") as f_out:
+with open(args.input, "rb", buffering=CHUNK_SIZE) as f_in, open(args.output, "wb", buffering=CHUNK_SIZE) as f_out:
+
+    # Output header lines unchanged
     for line in f_in:
-        # Output header lines unchanged 
-        if line.startswith("#"):
-            f_out.write(line)
+        if not line.startswith(b"#"):
+            break
+
+        f_out.write(line)
+    else:
+        line = b""
+
+    # Only complete lines are processed, a partial last line is carried over to the next chunk
+    carry = line
+    while chunk := f_in.read(CHUNK_SIZE):
+        chunk = carry + chunk
+        end = chunk.rfind(b"\n")
+        carry = chunk[end + 1:]
+        if end == -1:
             continue
 
-        # Change ID column (2nd) and write out 
-        chrom,pos,_,ref,alt,rest = line.split("\t", maxsplit=5)
-        f_out.write(f"{chrom}\t{pos}\t{chrom}:{pos}:{ref}:{alt}\t{ref}\t{alt}\t{rest}")
+        # Change ID column (2nd) of every line in the chunk and write out once.
+        # join sizes each output line up front instead of building it through
+        # a chain of intermediate concatenations
+        out = bytearray()
+        for line in chunk[:end].split(b"\n"):
+            chrom,pos,_,ref,alt,rest = line.split(b"\t", 5)
+            out += b"".join((chrom,b"\t",pos,b"\t",chrom,b":",pos,b":",ref,b":",alt,b"\t",ref,b"\t",alt,b"\t",rest,b"\n"))
+
+        f_out.write(out)
+
+    # Last line, which keeps its newline if it has one
+    if carry:
+        chrom,pos,_,ref,alt,rest = carry.split(b"\t", 5)
+        f_out.write(b"".join((chrom,b"\t",pos,b"\t",chrom,b":",pos,b":",ref,b":",alt,b"\t",ref,b"\t",alt,b"\t",rest)))
@@ -0,0 +1,78 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.12"
+# dependencies = []
+# ///
+import argparse
+import multiprocessing
+import os
+import shutil
+import tempfile
+
+
+def rewrite_range(path, start, end, out_path):
+    """Rewrite the data lines in bytes [start, end) of `path` into `out_path`."""
+    with open(path, "rb") as f_in, open(out_path, "wb") as f_out:
+        # Let the kernel read ahead aggressively for this worker's range, where supported
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(f_in.fileno(), start, end - start, os.POSIX_FADV_SEQUENTIAL)
+        f_in.seek(start)
+
+        pos = start
+        while pos < end:
+            line = f_in.readline()
+            pos += len(line)
+
+            # Change ID column (2nd) and write out
+            chrom,pos_,_,ref,alt,rest = line.split(b"\t", maxsplit=5)
+            f_out.write(b"".join((chrom,b"\t",pos_,b"\t",chrom,b":",pos_,b":",ref,b":",alt,b"\t",ref,b"\t",alt,b"\t",rest)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Modify VCF IDs using vanilla python split across processes')
+    parser.add_argument('-i', '--input', required=True, help='Input VCF file')
+    parser.add_argument('-o', '--output', required=True, help='Output VCF file')
+    args = parser.parse_args()
+
+    n_workers = os.cpu_count() or 1
+    size = os.path.getsize(args.input)
+
+    with open(args.input, "rb") as f_in, open(args.output, "wb") as f_out:
+
+        # Output header lines unchanged, data starts after the last one
+        data_start = 0
+        for line in f_in:
+            if not line.startswith(b"#"):
+                break
+
+            f_out.write(line)
+            data_start += len(line)
+
+        # Split the data into roughly equal byte ranges that start at a line start.
+        # Seeking one byte back before readline keeps an offset that is already a
+        # line start in its own range
+        bounds = [data_start]
+        step = (size - data_start) // n_workers
+        for i in range(1, n_workers):
+            f_in.seek(max(data_start + i * step - 1, bounds[-1]))
+            f_in.readline()
+            bounds.append(min(f_in.tell(), size))
+        bounds.append(size)
+
+        with tempfile.TemporaryDirectory(dir=os.path.dirname(os.path.abspath(args.output))) as tmp_dir:
+            jobs = [
+                (args.input, start, end, os.path.join(tmp_dir, f"{i}.vcf"))
+                for i, (start, end) in enumerate(zip(bounds, bounds[1:]))
+            ]
+
+            with multiprocessing.Pool(n_workers) as pool:
+                pool.starmap(rewrite_range, jobs)
+
+            # Concatenate the rewritten ranges in order after the header
+            for *_, out_path in jobs:
+                with open(out_path, "rb") as f_part:
+                    shutil.copyfileobj(f_part, f_out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+use std::io;
+
+use pyo3::exceptions::PyValueError;
+use pyo3::prelude::*;
+
+mod rewrite;
+
+/// Write `input` to `output` with IDs set to CHROM:POS:REF:ALT.
+#[pyfunction]
+fn rewrite(input: &str, output: &str) -> PyResult<()> {
+    rewrite::rewrite_file(input.as_ref(), output.as_ref()).map_err(|e| match e.kind() {
+        io::ErrorKind::InvalidData => PyValueError::new_err(e.to_string()),
+        _ => e.into(),
+    })
+}
+
+#[pymodule]
+fn vcf_rewrite_rs(m: &Bound<'_, PyModule>) -> PyResult<()> {
+    m.add_function(wrap_pyfunction!(rewrite, m)?)?;
+    Ok(())
+}
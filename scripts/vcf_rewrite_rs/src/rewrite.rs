@@ -0,0 +1,63 @@
+use std::fs::File;
+use std::io::{self, BufWriter, Write};
+use std::path::Path;
+
+use memchr::memchr_iter;
+use memmap2::Mmap;
+
+/// Write `input` to `output` with IDs set to CHROM:POS:REF:ALT.
+///
+/// A data line with fewer than 6 tab-separated fields is an
+/// `io::ErrorKind::InvalidData` error.
+pub fn rewrite_file(input: &Path, output: &Path) -> io::Result<()> {
+    let input = File::open(input)?;
+    // Safety: the input file is not expected to change while it is being read
+    let mm = unsafe { Mmap::map(&input)? };
+
+    let output = File::create(output)?;
+    let mut writer = BufWriter::with_capacity(1 << 20, output);
+
+    let mut start = 0;
+    let mut newlines = memchr_iter(b'\n', &mm);
+    while start < mm.len() {
+        let end = newlines.next().map_or(mm.len(), |i| i + 1);
+        let line = &mm[start..end];
+        start = end;
+
+        // Output header lines unchanged
+        if line.starts_with(b"#") {
+            writer.write_all(line)?;
+            continue;
+        }
+
+        // Positions of the tabs after CHROM, POS, ID, REF and ALT
+        let mut tabs = [0usize; 5];
+        let mut found = 0;
+        for (slot, i) in tabs.iter_mut().zip(memchr_iter(b'\t', line)) {
+            *slot = i;
+            found += 1;
+        }
+        if found < tabs.len() {
+            return Err(io::Error::new(
+                io::ErrorKind::InvalidData,
+                format!(
+                    "Expected at least 6 tab-separated fields in line: {:?}",
+                    String::from_utf8_lossy(line).trim_end_matches('\n')
+                ),
+            ));
+        }
+
+        // CHROM and POS, then the new ID, then REF onwards unchanged
+        writer.write_all(&line[..tabs[1] + 1])?;
+        writer.write_all(&line[..tabs[0]])?;
+        writer.write_all(b":")?;
+        writer.write_all(&line[tabs[0] + 1..tabs[1]])?;
+        writer.write_all(b":")?;
+        writer.write_all(&line[tabs[2] + 1..tabs[3]])?;
+        writer.write_all(b":")?;
+        writer.write_all(&line[tabs[3] + 1..tabs[4]])?;
+        writer.write_all(&line[tabs[2]..])?;
+    }
+
+    writer.flush()
+}